@@ -1,67 +1,100 @@
-﻿import os
+﻿import functools
+import importlib
+import os
 import sys
 import platform
+import shlex
 import subprocess
 import shutil
+import site
+import sysconfig
 
 
-def is_windows():
-    return platform.system() == "Windows"
-
+# The platform can't change while the build runs, so look it up once
+_SYS = platform.system()
+IS_WINDOWS = _SYS == "Windows"
+IS_MACOS = _SYS == "Darwin"
+IS_LINUX = _SYS == "Linux"
 
-def is_macos():
-    return platform.system() == "Darwin"
 
+@functools.lru_cache(maxsize=None)
+def _split_command(command):
+    """Split a command string into an argument tuple"""
+    return tuple(shlex.split(command, posix=not IS_WINDOWS))
 
-def is_linux():
-    return platform.system() == "Linux"
 
+def run_command(command, capture=False):
+    """Run a command and return its output
 
-def run_command(command):
-    """Run a command and return its output"""
+    Commands should be given as argument lists; strings are split with shlex.
+    Output is only collected when ``capture`` is true; otherwise stdout is
+    discarded and True is returned on success. Returns False on failure.
+    """
     print(f"Executing: {command}")
-    try:
-        # On Windows, we need to handle paths differently
-        if is_windows():
-            # Use subprocess with shell=False and args as list for better path handling
-            if isinstance(command, list):
-                args = command
-            else:
-                args = command.split()
+    if capture:
+        streams = {"capture_output": True}
+    else:
+        # Keep stderr so failures can still be reported
+        streams = {"stdout": subprocess.DEVNULL, "stderr": subprocess.PIPE}
 
-            result = subprocess.run(args, shell=False, capture_output=True, text=True)
-        else:
-            # On Unix systems, shell=True works fine
-            result = subprocess.run(command, shell=True, capture_output=True, text=True)
+    try:
+        # Run without a shell so no extra /bin/sh process is spawned
+        args = command if isinstance(command, list) else list(_split_command(command))
+        result = subprocess.run(args, shell=False, text=True, **streams)
 
         if result.returncode != 0:
             print(f"Command failed with exit code {result.returncode}")
             print(f"Error: {result.stderr}")
             return False
-        return result.stdout.strip()
+        return result.stdout.strip() if capture else True
     except Exception as e:
         print(f"Error executing command: {e}")
         return False
 
 
+def refresh_import_paths():
+    """Make packages installed by this run importable in this process
+
+    Re-adding site-packages processes .pth files written since start-up
+    (pywin32 puts its win32 directories on sys.path that way). The user site
+    directory is added too, in case pip fell back to a --user install and the
+    directory didn't exist when the interpreter started.
+    """
+    site.addsitedir(sysconfig.get_paths()["purelib"])
+    if site.ENABLE_USER_SITE:
+        site.addsitedir(site.getusersitepackages())
+    importlib.invalidate_caches()
+
+
 def install_dependencies():
     """Install required dependencies for the build"""
     print("Installing required dependencies...")
 
     python_exe = sys.executable
 
+    # Let CI point pip at a cache directory it persists between jobs;
+    # otherwise pip's own cache settings are left alone
+    cache_dir = os.environ.get("LH_PIP_CACHE")
+    if cache_dir:
+        os.environ["PIP_CACHE_DIR"] = cache_dir
+        print(f"Using pip cache: {cache_dir}")
+
     # Common dependencies
     if not run_command([python_exe, "-m", "pip", "install", "--upgrade", "pip"]):
         print("Warning: Failed to upgrade pip, continuing anyway...")
 
-    run_command([python_exe, "-m", "pip", "install", "PyQt5", "pynput"])
-    run_command([python_exe, "-m", "pip", "install", "pyinstaller"])
+    # Install everything in a single pip run so the interpreter and resolver
+    # only start once
+    packages = ["PyQt5", "pynput", "pyinstaller"]
 
-    if is_windows():
+    if IS_WINDOWS:
         # Windows-specific dependencies for shortcuts
-        run_command([python_exe, "-m", "pip", "install", "pywin32", "winshell"])
+        packages += ["pywin32", "winshell"]
 
-    print("Dependencies installed successfully.")
+    if not run_command([python_exe, "-m", "pip", "install", *packages]):
+        print("Warning: Failed to install dependencies, continuing anyway...")
+    else:
+        print("Dependencies installed successfully.")
 
 
 def create_icon():
@@ -76,42 +109,26 @@ def create_icon():
     try:
         run_command([sys.executable, "-m", "pip", "install", "pillow"])
 
-        icon_script = """
-from PIL import Image, ImageDraw
-
-# Create a new image with a transparent background
-img = Image.new('RGBA', (256, 256), color=(255, 255, 255, 0))
-
-# Get a drawing context
-draw = ImageDraw.Draw(img)
+        # Pillow may have just been installed, so refresh the import system's view
+        refresh_import_paths()
+        from PIL import Image, ImageDraw
 
-# Draw a yellow highlighter rectangle
-draw.rectangle((64, 96, 192, 160), fill=(255, 255, 0, 180))
+        # Create a new image with a transparent background
+        img = Image.new('RGBA', (256, 256), color=(255, 255, 255, 0))
 
-# Save files
-if '{system}' == 'Darwin':
-    # For macOS we need PNG
-    img.save('{icon_path}')
-else:
-    # For Windows and Linux we use ICO
-    img.save('{icon_path}', sizes=[(16, 16), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)])
-"""
+        # Get a drawing context
+        draw = ImageDraw.Draw(img)
 
-        icon_script = icon_script.format(
-            system=platform.system(),
-            icon_path=icon_path
-        )
+        # Draw a yellow highlighter rectangle
+        draw.rectangle((64, 96, 192, 160), fill=(255, 255, 0, 180))
 
-        # Save the icon creation script as a temporary file
-        with open("temp_icon_script.py", "w") as f:
-            f.write(icon_script)
-
-        # Run the script
-        run_command([sys.executable, "temp_icon_script.py"])
-
-        # Clean up
-        if os.path.exists("temp_icon_script.py"):
-            os.remove("temp_icon_script.py")
+        # Save files
+        if IS_MACOS:
+            # For macOS we need PNG
+            img.save(icon_path)
+        else:
+            # For Windows and Linux we use ICO
+            img.save(icon_path, sizes=[(16, 16), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)])
 
         print(f"Icon created: {icon_path}")
     except Exception as e:
@@ -121,7 +138,7 @@ else:
 
 def get_icon_path():
     """Return the appropriate icon path based on the platform"""
-    if is_macos():
+    if IS_MACOS:
         return "highlighter.png"
     else:  # Windows or Linux
         return "highlighter.ico"
@@ -129,7 +146,7 @@ def get_icon_path():
 
 def build_executable():
     """Build the executable for the current platform"""
-    print(f"Building executable for {platform.system()}...")
+    print(f"Building executable for {_SYS}...")
 
     script_dir = os.path.dirname(os.path.abspath(__file__))
     main_script = os.path.join(script_dir, "highlighter.py")
@@ -154,12 +171,12 @@ def build_executable():
         cmd.append(f"--icon={icon_path}")
 
     # Platform-specific options
-    if is_windows():
+    if IS_WINDOWS:
         cmd.append(f"--add-data={get_icon_path()};.")
-    elif is_macos():
+    elif IS_MACOS:
         cmd.append(f"--add-data=highlighter.png:.")
         cmd.append("--target-architecture=x86_64")  # Ensure compatibility
-    elif is_linux():
+    elif IS_LINUX:
         cmd.append(f"--add-data=highlighter.ico:.")
 
     # Add hidden imports
@@ -170,9 +187,9 @@ def build_executable():
     success = run_command(cmd)
 
     # Check if build was successful
-    if is_windows():
+    if IS_WINDOWS:
         exe_path = os.path.join(script_dir, "dist", "LineHighlighter.exe")
-    elif is_macos():
+    elif IS_MACOS:
         exe_path = os.path.join(script_dir, "dist", "LineHighlighter.app", "Contents", "MacOS", "LineHighlighter")
     else:  # Linux
         exe_path = os.path.join(script_dir, "dist", "LineHighlighter")
@@ -194,42 +211,25 @@ def create_desktop_shortcut(exe_path):
     print("Creating desktop shortcut...")
 
     try:
-        if is_windows():
+        if IS_WINDOWS:
             # Windows shortcut - create directly with Python
-            shortcut_script = """
-import os
-import sys
-import winshell
-from win32com.client import Dispatch
-
-desktop = winshell.desktop()
-path = os.path.join(desktop, "Line Highlighter.lnk")
-
-shell = Dispatch('WScript.Shell')
-shortcut = shell.CreateShortCut(path)
-shortcut.Targetpath = r'{exe_path}'
-shortcut.WorkingDirectory = r'{work_dir}'
-shortcut.IconLocation = r'{icon_loc}'
-shortcut.save()
-
-print(f"Shortcut created at: {{path}}")
-"""
-            shortcut_script = shortcut_script.format(
-                exe_path=exe_path,
-                work_dir=os.path.dirname(exe_path),
-                icon_loc=exe_path
-            )
+            refresh_import_paths()
+            import winshell
+            from win32com.client import Dispatch
 
-            with open("create_shortcut.py", "w") as f:
-                f.write(shortcut_script)
+            desktop = winshell.desktop()
+            path = os.path.join(desktop, "Line Highlighter.lnk")
 
-            run_command([sys.executable, "create_shortcut.py"])
+            shell = Dispatch('WScript.Shell')
+            shortcut = shell.CreateShortCut(path)
+            shortcut.Targetpath = exe_path
+            shortcut.WorkingDirectory = os.path.dirname(exe_path)
+            shortcut.IconLocation = exe_path
+            shortcut.save()
 
-            # Clean up
-            if os.path.exists("create_shortcut.py"):
-                os.remove("create_shortcut.py")
+            print(f"Shortcut created at: {path}")
 
-        elif is_macos():
+        elif IS_MACOS:
             # macOS .app bundle should already be created by PyInstaller
             desktop_path = os.path.expanduser("~/Desktop")
             app_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(exe_path))), "LineHighlighter.app")
@@ -243,7 +243,7 @@ print(f"Shortcut created at: {{path}}")
             else:
                 print("macOS app bundle not found")
 
-        elif is_linux():
+        elif IS_LINUX:
             # Linux .desktop file
             desktop_path = os.path.expanduser("~/Desktop")
             desktop_file = os.path.join(desktop_path, "LineHighlighter.desktop")
@@ -273,7 +273,7 @@ def main():
     print("======================================")
     print("LineHighlighter Cross-Platform Builder")
     print("======================================")
-    print(f"Platform: {platform.system()}")
+    print(f"Platform: {_SYS}")
     print(f"Python: {platform.python_version()}")
     print(f"Python executable: {sys.executable}")
     print("--------------------------------------")
@@ -9,19 +9,78 @@ on/off directly from the settings dialog.
 """
 from __future__ import annotations
 
+import importlib
+import logging
 import sys
-import threading
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 try:
     from PyQt5 import QtGui, QtCore, QtWidgets
 except Exception:  # pragma: no cover - PyQt5 might not be installed
     QtGui = QtCore = QtWidgets = None  # type: ignore
 
-try:
-    from pynput import keyboard  # type: ignore
-except Exception:  # pragma: no cover - optional dependency
-    keyboard = None
+logger = logging.getLogger(__name__)
+
+
+def _import_pynput(name: str):
+    """Import a pynput submodule on first use, or return None if unavailable.
+
+    pynput connects to the platform's input backend when imported, so this is
+    deferred until the highlighter is actually started.
+    """
+    try:
+        return importlib.import_module(f'pynput.{name}')
+    except Exception:  # pragma: no cover - optional dependency
+        return None
+
+
+# Width of the primary screen; filled on first use and cleared by the
+# Controller whenever the primary screen or its geometry changes
+_primary_w: int | None = None
+
+
+def _primary_screen_width() -> int:
+    global _primary_w
+    if _primary_w is None:
+        _primary_w = QtWidgets.QApplication.primaryScreen().size().width()
+    return _primary_w
+
+
+def _reset_primary_screen_width(*_):
+    global _primary_w
+    _primary_w = None
+
+
+if sys.platform.startswith('win'):  # pragma: no cover - platform specific
+    import ctypes
+    from ctypes import wintypes
+
+    # Bind the user32 calls once with explicit signatures so each call skips
+    # the attribute lookup and default argument conversion
+    _user32 = ctypes.WinDLL('user32', use_last_error=True)
+    _GetWindowLongW = _user32.GetWindowLongW
+    _GetWindowLongW.argtypes = [wintypes.HWND, ctypes.c_int]
+    _GetWindowLongW.restype = ctypes.c_long
+    _SetWindowLongW = _user32.SetWindowLongW
+    _SetWindowLongW.argtypes = [wintypes.HWND, ctypes.c_int, ctypes.c_long]
+    _SetWindowLongW.restype = ctypes.c_long
+    _SetLayeredWindowAttributes = _user32.SetLayeredWindowAttributes
+    _SetLayeredWindowAttributes.argtypes = [wintypes.HWND, wintypes.COLORREF,
+                                            wintypes.BYTE, wintypes.DWORD]
+    _SetLayeredWindowAttributes.restype = wintypes.BOOL
+elif sys.platform == 'darwin':  # pragma: no cover - platform specific
+    import ctypes
+    import ctypes.util
+
+    # Load the Objective-C runtime and look the selector up once; failures
+    # are reported when click-through is applied
+    try:
+        _objc = ctypes.cdll.LoadLibrary(ctypes.util.find_library('objc'))
+        _objc.sel_registerName.restype = ctypes.c_void_p
+        _objc.objc_msgSend.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_bool]
+        _SEL_SET_IGNORES_MOUSE_EVENTS = _objc.sel_registerName(b'setIgnoresMouseEvents:')
+    except Exception:
+        _objc = None
 
 
 @dataclass
@@ -29,95 +88,138 @@ class Settings:
     width: int = 800
     height: int = 30
     alpha: float = 0.3
-    color: QtGui.QColor = QtGui.QColor(255, 255, 0, int(0.3 * 255))
+    color: QtGui.QColor = field(default_factory=lambda: QtGui.QColor(255, 255, 0, int(0.3 * 255)))
 
 
-class HotkeyListener(threading.Thread):
-    """Background listener for a single key using pynput."""
+class HotkeyListener:
+    """Background listener for a single key using pynput.
+
+    pynput listeners already run on their own thread, so this only wraps one
+    and forwards ``start``/``stop`` to it.
+    """
 
     def __init__(self, key: str, callback):
-        super().__init__(daemon=True)
-        self._key = key.lower()
+        self._key = self._hotkey_spec(key)
         self._callback = callback
-        self._listener = keyboard.Listener(on_press=self._on_press)
-
-    def _on_press(self, key):
-        try:
-            name = key.char.lower() if hasattr(key, 'char') and key.char else key.name.lower()
-        except AttributeError:
-            name = ''
-        if name == self._key:
-            self._callback()
-
-    def run(self):
-        with self._listener:
-            self._listener.join()
+        # GlobalHotKeys matches the parsed key itself, so no Python code runs
+        # for unrelated key presses
+        keyboard = _import_pynput('keyboard')
+        if keyboard is None:
+            raise RuntimeError('pynput is required for hotkeys.')
+        self._listener = keyboard.GlobalHotKeys({self._key: self._callback})
+
+    @staticmethod
+    def _hotkey_spec(key: str) -> str:
+        """Convert a key name such as 'esc' or 'q' into pynput's hotkey format."""
+        key = key.lower()
+        return key if len(key) == 1 else f'<{key}>'
+
+    def start(self):
+        self._listener.start()
 
     def stop(self):
         self._listener.stop()
 
 
 class HighlightBar(QtWidgets.QWidget):
+    # Emitted from the pynput listener thread; queued onto the GUI thread
+    cursor_moved = QtCore.pyqtSignal()
+
     def __init__(self, settings: Settings):
         super().__init__(flags=QtCore.Qt.Tool | QtCore.Qt.FramelessWindowHint | QtCore.Qt.WindowStaysOnTopHint)
         self.settings = settings
         self.setAttribute(QtCore.Qt.WA_TranslucentBackground)
         self.setAttribute(QtCore.Qt.WA_TransparentForMouseEvents)
-        cursor_screen = QtWidgets.QApplication.screenAt(QtGui.QCursor.pos())
-        screen_w = (cursor_screen.geometry().width()
-                    if cursor_screen is not None
-                    else QtWidgets.QApplication.primaryScreen().size().width())
-
-        # Force the width explicitly, but respect the user's setting if possible
-        self._desired_width = min(self.settings.width, screen_w)
-        self._desired_height = self.settings.height
 
-        # Set the fixed size to prevent any automatic resizing
-        self.setFixedSize(self._desired_width, self._desired_height)
-
-        self._timer = QtCore.QTimer(self, timeout=self.update_position)
-        self._timer.start(10)
+        # Sized to the screen under the cursor by the first update_position()
+        self._desired_width = None
+        self._desired_height = None
+        self._h2 = 0
+
+        # Follow the cursor through a global mouse hook so nothing runs while
+        # the mouse is idle; without pynput, poll once per display frame
+        self._screen_geo = None
+        self._x = 0
+        self._last_y = None
+        # Drop the cached screen geometry whenever the screen layout changes
+        app = QtWidgets.QApplication.instance()
+        app.screenAdded.connect(self._on_screen_added)
+        app.screenRemoved.connect(self._invalidate_screen)
+        for screen in app.screens():
+            screen.geometryChanged.connect(self._invalidate_screen)
+        # Tracking only runs while the bar is shown, see showEvent/hideEvent
+        self._mouse_listener = None
+        self._timer = None
+        # Set while a cursor_moved emit is queued so fast mice don't flood
+        # the GUI thread with updates
+        self._move_pending = False
+        self.cursor_moved.connect(self.update_position)
+        self._mouse = _import_pynput('mouse')
+        if self._mouse is None:
+            refresh = QtWidgets.QApplication.primaryScreen().refreshRate()
+            self._timer = QtCore.QTimer(self, timeout=self.update_position)
+            self._timer.setInterval(max(1, int(1000 / refresh)) if refresh > 0 else 16)
         self._color = self.settings.color
+        self._paint_color = self._make_paint_color(self.settings)
 
         self._click_through_applied = False
+        self._hwnd = None
+        self.update_position()
+
+    def _on_mouse_move(self, x, y):
+        # Runs on the listener thread, so only hand the work over to Qt.
+        # The position is re-read there because pynput reports physical
+        # pixels while Qt works in device-independent ones.
+        if not self._move_pending:
+            self._move_pending = True
+            self.cursor_moved.emit()
+
+    def showEvent(self, event):
+        self.update_position()
+        if self._timer is not None:
+            self._timer.start()
+        elif self._mouse_listener is None:
+            # pynput listeners are threads and can't be restarted
+            self._mouse_listener = self._mouse.Listener(on_move=self._on_mouse_move)
+            self._mouse_listener.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        if self._timer is not None:
+            self._timer.stop()
+        elif self._mouse_listener is not None:
+            self._mouse_listener.stop()
+            self._mouse_listener = None
+        super().hideEvent(event)
 
     def _make_click_through_win(self):
         try:
-            import ctypes
-            hwnd = int(self.winId())
+            hwnd = self._hwnd
             GWL_EXSTYLE = -20
             WS_EX_LAYERED = 0x00080000
             WS_EX_TRANSPARENT = 0x00000020
-            ctypes.windll.user32.SetWindowLongW(hwnd, GWL_EXSTYLE,
-                                                ctypes.windll.user32.GetWindowLongW(hwnd,
-                                                                                    GWL_EXSTYLE) | WS_EX_LAYERED | WS_EX_TRANSPARENT)
-            ctypes.windll.user32.SetLayeredWindowAttributes(hwnd, 0,
-                                                            int(self.settings.alpha * 255), 0x02)
-        except Exception as e:
-            print(f"Error applying Windows click-through: {e}")
-            pass
+            _SetWindowLongW(hwnd, GWL_EXSTYLE,
+                            _GetWindowLongW(hwnd, GWL_EXSTYLE) | WS_EX_LAYERED | WS_EX_TRANSPARENT)
+            _SetLayeredWindowAttributes(hwnd, 0, int(self.settings.alpha * 255), 0x02)
+        except Exception:
+            logger.exception("Error applying Windows click-through")
 
     def _make_click_through_mac(self):
         try:
-            import ctypes
-            import ctypes.util
-            objc = ctypes.cdll.LoadLibrary(ctypes.util.find_library('objc'))
-            objc.objc_getClass.restype = ctypes.c_void_p
+            if _objc is None:
+                raise OSError('Objective-C runtime not available')
             ns_window = ctypes.c_void_p(int(self.winId()))
-            sel = objc.sel_registerName(b'setIgnoresMouseEvents:')
-            objc.objc_msgSend.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_bool]
-            objc.objc_msgSend(ns_window, sel, True)
-        except Exception as e:
-            print(f"Error applying Mac click-through: {e}")
-            pass
+            _objc.objc_msgSend(ns_window, _SEL_SET_IGNORES_MOUSE_EVENTS, True)
+        except Exception:
+            logger.exception("Error applying Mac click-through")
 
     def apply_click_through(self):
         if self._click_through_applied:
             return
         if sys.platform.startswith('win'):
+            # The native handle doesn't change, so look it up only once
+            self._hwnd = int(self.winId())
             self._make_click_through_win()
-            # Reapply the fixed size after changing window style
-            self.setFixedSize(self._desired_width, self._desired_height)
         elif sys.platform == 'darwin':
             self._make_click_through_mac()
         # Linux typically works with WA_TransparentForMouseEvents only
@@ -126,72 +228,106 @@ class HighlightBar(QtWidgets.QWidget):
     def _update_alpha_win(self):
         """Update transparency on Windows when settings change."""
         try:
-            import ctypes
-            hwnd = int(self.winId())
-            ctypes.windll.user32.SetLayeredWindowAttributes(
-                hwnd, 0, int(self.settings.alpha * 255), 0x02
-            )
-        except Exception as e:  # pragma: no cover - platform specific
-            print(f"Error updating Windows alpha: {e}")
-            pass
+            _SetLayeredWindowAttributes(self._hwnd, 0, int(self.settings.alpha * 255), 0x02)
+        except Exception:  # pragma: no cover - platform specific
+            logger.exception("Error updating Windows alpha")
 
     # This method needs to be un-indented to become a class method
     def update_settings(self, settings: Settings):
+        # Skip redundant updates; colours are compared via rgba() because
+        # QColor's == also compares the colour spec (RGB vs HSV)
+        if self._settings_key(settings) == self._settings_key(self.settings):
+            return
         old_color = self._color
+        old_alpha = self.settings.alpha
         self.settings = settings
-        screen = QtWidgets.QApplication.screenAt(QtGui.QCursor.pos())
-        screen_w = (screen.geometry().width()
-                     if screen is not None
-                     else QtWidgets.QApplication.primaryScreen().size().width())
-
-        # Update desired dimensions; width will be clamped in update_position
-        self._desired_width = min(settings.width, screen_w)
-        self._desired_height = settings.height
-
-        # Apply as fixed size immediately
-        self.setFixedSize(self._desired_width, self._desired_height)
-
-        # Create a completely new QColor to avoid reference issues
-        self._color = QtGui.QColor(
-            settings.color.red(),
-            settings.color.green(),
-            settings.color.blue()
-        )
 
-        if sys.platform.startswith('win') and self._click_through_applied:
+        # Re-fit the bar to the current screen and re-centre it on the cursor
+        self._invalidate_screen()
+        self.update_position()
+
+        self._color = settings.color
+
+        self._paint_color = self._make_paint_color(settings)
+
+        # Resetting the layered-window alpha makes the compositor redraw, so
+        # only do it when the transparency actually changed
+        if (sys.platform.startswith('win') and self._click_through_applied
+                and settings.alpha != old_alpha):
             self._update_alpha_win()
 
-        # Force a complete repaint
-        self.update()
-        # Process any pending events immediately
-        QtWidgets.QApplication.processEvents()
+        # Only repaint when the colour changed; a resize repaints by itself
+        if self._color != old_color or settings.alpha != old_alpha:
+            self.update()
 
-    def update_position(self):
-        pos = QtGui.QCursor.pos()
+    def _on_screen_added(self, screen: QtGui.QScreen):
+        screen.geometryChanged.connect(self._invalidate_screen)
+        self._invalidate_screen()
+
+    def _invalidate_screen(self, *_):
+        self._screen_geo = None
+
+    def _apply_geometry(self, width: int, height: int):
+        """Fix the bar to ``width`` x ``height`` unless it already has that size."""
+        if (width, height) == (self._desired_width, self._desired_height):
+            return
+        self._desired_width = width
+        self._desired_height = height
+        self._h2 = height // 2
+        # Set the fixed size to prevent any automatic resizing
+        self.setFixedSize(width, height)
+
+    def _update_screen(self, pos: QtCore.QPoint):
+        """Cache the geometry of the screen under ``pos`` and fit the bar to it."""
         screen = QtWidgets.QApplication.screenAt(pos)
         if screen is not None:
             geo = screen.geometry()
-            # Adjust width for the current screen
+            self._screen_geo = geo
+            self._x = geo.x()
             screen_w = geo.width()
-            new_width = min(self.settings.width, screen_w)
-            if new_width != self._desired_width:
-                self._desired_width = new_width
-                self.setFixedSize(self._desired_width, self._desired_height)
-            x = geo.x()
         else:
             # Fallback to primary screen origin
-            x = 0
-        y = pos.y() - self._desired_height // 2
-        self.move(x, y)
-        self.repaint()
+            self._screen_geo = None
+            self._x = 0
+            screen_w = _primary_screen_width()
+        # Respect the user's width as far as the screen allows
+        self._apply_geometry(min(self.settings.width, screen_w), self.settings.height)
+        # The x position may have changed, so force the next move
+        self._last_y = None
+
+    def update_position(self):
+        # Cleared before reading the cursor so a move arriving meanwhile
+        # queues another update instead of being lost
+        self._move_pending = False
+        pos = QtGui.QCursor.pos()
+        # Only look the screen up again once the cursor leaves the cached one
+        if self._screen_geo is None or not self._screen_geo.contains(pos):
+            self._update_screen(pos)
+        y = pos.y() - self._h2
+        # Horizontal motion keeps the bar where it is
+        if y == self._last_y:
+            return
+        self._last_y = y
+        # The bar is a solid fill, so moving it doesn't need a repaint
+        self.move(self._x, y)
+
+    @staticmethod
+    def _settings_key(settings: Settings) -> tuple:
+        return settings.width, settings.height, settings.alpha, settings.color.rgba()
+
+    @staticmethod
+    def _make_paint_color(settings: Settings) -> QtGui.QColor:
+        """Build the fill colour once so paintEvent doesn't allocate."""
+        colour = QtGui.QColor(settings.color)
+        colour.setAlphaF(settings.alpha)
+        return colour
 
     def paintEvent(self, event):
         p = QtGui.QPainter(self)
-        # Create a new color object directly from RGBA values to avoid any reference issues
-        r, g, b = self._color.red(), self._color.green(), self._color.blue()
-        colour = QtGui.QColor(r, g, b)
-        colour.setAlphaF(self.settings.alpha)
-        p.fillRect(self.rect(), colour)
+        # The fill alone defines each pixel, so write it instead of blending,
+        # and only cover the area Qt asked to repaint
+        p.setCompositionMode(QtGui.QPainter.CompositionMode_Source)
+        p.fillRect(event.rect(), self._paint_color)
         p.end()
 
 
@@ -212,13 +348,19 @@ class SettingsDialog(QtWidgets.QWidget):
         # Clear any stored window geometry that might interfere
         self.clearWindowSettings()
 
-        screen_w = QtWidgets.QApplication.primaryScreen().size().width()
+        screen_w = _primary_screen_width()
+
+        # Fetch the stored keys once and only look up the ones that exist
+        keys = set(self.settings.allKeys())
+
+        def stored(key, default):
+            return self.settings.value(key) if key in keys else default
 
         # Safely retrieve values with better type handling
-        width_value = self.settings.value('width', str(screen_w))
-        height_value = self.settings.value('height', '30')
-        alpha_value = self.settings.value('alpha', '0.3')
-        color_hex = self.settings.value('color', '#ffff00')
+        width_value = stored('width', str(screen_w))
+        height_value = stored('height', '30')
+        alpha_value = stored('alpha', '0.3')
+        color_hex = stored('color', '#ffff00')
 
         # Convert with proper error handling
         try:
@@ -231,6 +373,11 @@ class SettingsDialog(QtWidgets.QWidget):
             height = 30
             alpha = 0.3
 
+        # Last values written to QSettings, so unchanged keys aren't rewritten;
+        # seeded with what is already stored
+        loaded = {'width': width_value, 'height': height_value,
+                  'alpha': alpha_value, 'color': color_hex}
+        self._saved = {key: str(value) for key, value in loaded.items() if key in keys}
 
         # Create width spinner with screen width as maximum
         self.width_spin = QtWidgets.QSpinBox()
@@ -244,15 +391,20 @@ class SettingsDialog(QtWidgets.QWidget):
         self.alpha_spin.setMaximumWidth(80)
         self.color_btn = QtWidgets.QPushButton('Choose…')
 
+        # Bursts of changes (held spin box arrows, colour picker drags) are
+        # collapsed into a single settings_changed emit
+        self._changed_timer = QtCore.QTimer(self, singleShot=True, interval=50,
+                                            timeout=self.settings_changed.emit)
+
         # Emit signal when any setting changes
         self.width_spin.valueChanged.connect(
-            lambda _=None: self.settings_changed.emit()
+            lambda _=None: self._changed_timer.start()
         )
         self.height_spin.valueChanged.connect(
-            lambda _=None: self.settings_changed.emit()
+            lambda _=None: self._changed_timer.start()
         )
         self.alpha_spin.valueChanged.connect(
-            lambda _=None: self.settings_changed.emit()
+            lambda _=None: self._changed_timer.start()
         )
 
         # Add fields to form layout
@@ -288,12 +440,11 @@ class SettingsDialog(QtWidgets.QWidget):
 
     def clearWindowSettings(self):
         """Clear any stored window geometry/state from QSettings"""
-        self.settings.remove("geometry")
-        self.settings.remove("windowState")
-        self.settings.remove("size")
-        self.settings.remove("pos")
-        # These keys might not exist, but it's safe to try removing them
-        self.settings.sync()
+        # Only remove keys that exist so nothing is written when there is
+        # nothing to clear; QSettings flushes the removals on its own
+        for key in ("geometry", "windowState", "size", "pos"):
+            if self.settings.contains(key):
+                self.settings.remove(key)
 
     def choose_color(self):
         dialog = QtWidgets.QColorDialog(self.color, self)
@@ -323,8 +474,8 @@ class SettingsDialog(QtWidgets.QWidget):
             # Temporarily update the color
             self.color = QtGui.QColor(col.red(), col.green(), col.blue())
 
-            # Signal that settings changed to update the highlighter immediately
-            self.settings_changed.emit()
+            # Signal that settings changed to update the highlighter
+            self._changed_timer.start()
     
     def _update_color(self, col: QtGui.QColor):
         if col.isValid():
@@ -352,13 +503,17 @@ class SettingsDialog(QtWidgets.QWidget):
 
     def save_settings(self, s: Settings):
         # Store values as strings to avoid type conversion issues
-        self.settings.setValue('width', str(s.width))
-        self.settings.setValue('height', str(s.height))
-        self.settings.setValue('alpha', str(s.alpha))
-        self.settings.setValue('color', s.color.name())
-
-        # Force sync to ensure settings are written
-        self.settings.sync()
+        values = {
+            'width': str(s.width),
+            'height': str(s.height),
+            'alpha': str(s.alpha),
+            'color': s.color.name(),
+        }
+        # Only touch keys that changed; QSettings flushes to disk on its own
+        for key, value in values.items():
+            if self._saved.get(key) != value:
+                self.settings.setValue(key, value)
+                self._saved[key] = value
 
 
 class Controller:
@@ -366,9 +521,17 @@ class Controller:
         if QtWidgets is None:
             raise SystemExit('PyQt5 is required to run this program.')
         self.app = QtWidgets.QApplication(sys.argv)
+        self.app.primaryScreenChanged.connect(self._on_primary_screen_changed)
+        self.app.primaryScreen().geometryChanged.connect(_reset_primary_screen_width)
         self.dialog = SettingsDialog()
         self.overlay: HighlightBar | None = None
 
+        # Live changes are written to disk once they settle down
+        self._pending_settings: Settings | None = None
+        self._save_timer = QtCore.QTimer(singleShot=True, interval=250,
+                                         timeout=self.save_pending_settings)
+        self.app.aboutToQuit.connect(self._on_quit)
+
         # Connect the toggle button
         self.dialog.toggle_btn.clicked.connect(self.toggle_highlighter)
         self.dialog.settings_changed.connect(self.live_update_settings)
@@ -377,38 +540,33 @@ class Controller:
         self.dialog.show()
         sys.exit(self.app.exec_())
 
+    def _on_primary_screen_changed(self, screen: QtGui.QScreen):
+        screen.geometryChanged.connect(_reset_primary_screen_width)
+        _reset_primary_screen_width()
+
     def live_update_settings(self):
         """Update overlay immediately when settings change"""
-        if self.overlay is not None:
-            settings = self.dialog.get_settings()
-            
-            # Get current color of the overlay for comparison
-            current_color = self.overlay._color.name()
-            new_color = settings.color.name()
-            
-            # If color changed, recreate the highlighter
-            if current_color != new_color:
-                # Remember position
-                old_pos = self.overlay.pos()
-                
-                # Close the existing overlay
-                self.overlay.close()
-                
-                # Create a new one with the new settings
-                self.overlay = HighlightBar(settings)
-                
-                # Restore position and show it
-                self.overlay.move(old_pos)
-                self.overlay.show()
-                self.overlay.raise_()
-                QtWidgets.QApplication.processEvents()
-                self.overlay.apply_click_through()
-            else:
-                # For non-color changes, just update settings
-                self.overlay.update_settings(settings)
-        
-        # Save the settings
-        self.dialog.save_settings(settings)
+        settings = self.dialog.get_settings()
+        # A stopped (hidden) overlay picks the settings up in start_highlighter
+        if self.overlay is not None and self.dialog.highlighter_active:
+            # update_settings rebuilds the paint colour, so the existing
+            # window can be reused for colour changes too
+            self.overlay.update_settings(settings)
+
+        # Save the settings once the burst of changes is over
+        self._pending_settings = settings
+        self._save_timer.start()
+
+    def save_pending_settings(self):
+        """Write the most recent live settings to QSettings"""
+        self._save_timer.stop()
+        if self._pending_settings is not None:
+            self.dialog.save_settings(self._pending_settings)
+            self._pending_settings = None
+
+    def _on_quit(self):
+        self.save_pending_settings()
+        self.dialog.settings.sync()
 
         # Add this method to the Controller class
     def update_highlighter_color(self, color):
@@ -427,12 +585,12 @@ class Controller:
                 self.overlay.update_settings(new_settings)
                 # Save the settings
                 self.dialog.save_settings(new_settings)
-            except Exception as e:
-                print(f"Error updating color: {e}")
+            except Exception:
+                logger.exception("Error updating color")
 
     def toggle_highlighter(self):
         """Toggle the highlighter on/off"""
-        if self.overlay is None:
+        if not self.dialog.highlighter_active:
             # Start the highlighter
             self.start_highlighter()
             self.dialog.toggle_btn.setText('Stop Highlighter')
@@ -448,22 +606,26 @@ class Controller:
         settings = self.dialog.get_settings()
         self.dialog.save_settings(settings)
 
-        # Create new highlighter
-        self.overlay = HighlightBar(settings)
+        # The overlay window is created once and reused on later starts
+        if self.overlay is None:
+            self.overlay = HighlightBar(settings)
+        else:
+            self.overlay.update_settings(settings)
 
-        # Show and configure it
+        # Show and configure it; show() creates the native window, so the
+        # click-through styles can be applied straight away
         self.overlay.show()
         self.overlay.raise_()
-        QtWidgets.QApplication.processEvents()
         self.overlay.apply_click_through()
 
 
     def stop_highlighter(self):
         """Stop the highlighter"""
         if self.overlay:
-            self.overlay.close()
-            self.overlay = None
+            # Only hide it so the next start doesn't have to recreate the
+            # native window and reapply click-through
+            self.overlay.hide()
 
 
 if __name__ == '__main__':
-    Controller()
\ No newline at end of file
+    Controller()